@@ -0,0 +1,201 @@
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from collections import OrderedDict
+
+from config import (ADMISSION_BURST, ADMISSION_IDLE_CAP, ADMISSION_IDLE_WEIGHT,
+                    ADMISSION_MAX_PENDING, ADMISSION_PENDING_TIMEOUT,
+                    ADMISSION_QUEUE_LIMIT, ADMISSION_QUEUE_TIMEOUT,
+                    ADMISSION_RATE, ADMISSION_TRACKED_ACCOUNTS,
+                    ADMISSION_TRACKED_TXS)
+from crypto_utils import verify_signature
+from ledger import get_balance
+from node import process_transaction, vote_pool
+
+# In-memory state (LRU-bounded so forged or throwaway keys can't grow it forever)
+buckets = OrderedDict()    # { address: {"tokens": 5.0, "updated": 1700000000.0} }
+last_seen = OrderedDict()  # { address: timestamp of last admitted transaction }
+seen_txs = OrderedDict()   # { tx_id: None } for every tx queued or dispatched
+pending = OrderedDict()    # { tx_id: admitted timestamp } in admission order, while waiting for consensus
+queue = []                 # heap of (-score, seq, {"tx": .., "future": .., "dispatched": False})
+stats = {"admitted": 0, "duplicate": 0, "invalid": 0, "rate_limited": 0, "shed": 0}
+queued = 0                 # live entries in queue; timed-out ones are removed lazily
+in_flight = 0
+_sequence = itertools.count()
+_wake = None               # asyncio.Event that wakes the dispatcher
+_dispatcher = None
+_tasks = set()             # strong refs to dispatched _run tasks
+
+OVERLOADED = {"status": "rejected", "reason": "overloaded"}
+
+def _remember(table, key, value, limit):
+    table[key] = value
+    table.move_to_end(key)
+    while len(table) > limit:
+        table.popitem(last=False)
+
+# Token bucket per account: refill at ADMISSION_RATE/s up to ADMISSION_BURST
+def take_token(address, now=None):
+    now = time.monotonic() if now is None else now
+    bucket = buckets.get(address, {"tokens": ADMISSION_BURST, "updated": now})
+    elapsed = now - bucket["updated"]
+    bucket["tokens"] = min(ADMISSION_BURST, bucket["tokens"] + elapsed * ADMISSION_RATE)
+    bucket["updated"] = now
+    _remember(buckets, address, bucket, ADMISSION_TRACKED_ACCOUNTS)
+    if bucket["tokens"] < 1:
+        return False
+    bucket["tokens"] -= 1
+    return True
+
+# Higher score is served first. Idle time multiplies the balance term, so an
+# unfunded account never outranks a funded one however long it has been quiet.
+def priority_score(balance, idle_seconds):
+    idle = min(max(idle_seconds, 0.0), ADMISSION_IDLE_CAP)
+    return math.log1p(max(balance, 0.0)) * (1 + ADMISSION_IDLE_WEIGHT * idle / ADMISSION_IDLE_CAP)
+
+# Admitted transactions that never confirm stop counting after ADMISSION_PENDING_TIMEOUT.
+# pending is in admission order, so only the oldest entries need checking.
+def _expire_pending(now):
+    while pending:
+        if now - next(iter(pending.values())) <= ADMISSION_PENDING_TIMEOUT:
+            break
+        pending.popitem(last=False)
+
+def has_capacity(now=None):
+    _expire_pending(time.monotonic() if now is None else now)
+    return len(pending) + in_flight < ADMISSION_MAX_PENDING
+
+# Called by receive_vote when a transaction confirms and frees its slot
+def release(tx_id):
+    if pending.pop(tx_id, None) is not None:
+        _notify()
+
+def _notify():
+    if _wake is not None:
+        _wake.set()
+
+def _valid_signature(tx):
+    try:
+        return verify_signature(tx, tx["signature"], tx["address"])
+    except Exception:
+        return False
+
+async def submit_transaction(tx):
+    global in_flight, queued
+    tx_id = tx["id"]
+    address = tx["address"]
+    now = time.monotonic()
+
+    # Relayed copies and replays cost nothing and are not processed again
+    if tx_id in seen_txs or tx_id in vote_pool:
+        stats["duplicate"] += 1
+        return {"status": "rejected", "reason": "duplicate"}
+
+    # Only charge an account's bucket for transactions it actually signed
+    if not _valid_signature(tx):
+        stats["invalid"] += 1
+        return {"status": "rejected", "reason": "invalid signature"}
+
+    if not take_token(address, now):
+        stats["rate_limited"] += 1
+        return {"status": "rejected", "reason": "rate limited"}
+
+    # Fast path: nothing waiting and capacity free, so skip the balance lookup
+    if queued == 0 and has_capacity(now):
+        _remember(seen_txs, tx_id, None, ADMISSION_TRACKED_TXS)
+        _remember(last_seen, address, now, ADMISSION_TRACKED_ACCOUNTS)
+        in_flight += 1
+        stats["admitted"] += 1
+        return await _execute(tx)
+
+    # Shed before touching the ledger so a flood doesn't pay for balance lookups
+    if queued >= ADMISSION_QUEUE_LIMIT:
+        stats["shed"] += 1
+        return OVERLOADED
+
+    balance = await get_balance(address)
+    idle_seconds = now - last_seen[address] if address in last_seen else 0.0
+    _remember(seen_txs, tx_id, None, ADMISSION_TRACKED_TXS)
+    _remember(last_seen, address, now, ADMISSION_TRACKED_ACCOUNTS)
+
+    entry = {"tx": tx, "future": asyncio.get_running_loop().create_future(), "dispatched": False}
+    heapq.heappush(queue, (-priority_score(balance, idle_seconds), next(_sequence), entry))
+    queued += 1
+    _compact()
+    _ensure_dispatcher()
+    _notify()
+
+    try:
+        return await asyncio.wait_for(asyncio.shield(entry["future"]), ADMISSION_QUEUE_TIMEOUT)
+    except asyncio.TimeoutError:
+        if entry["dispatched"]:
+            return await entry["future"]
+        # Resolving the future marks the heap entry dead; the dispatcher skips it
+        queued -= 1
+        stats["shed"] += 1
+        seen_txs.pop(tx_id, None)
+        entry["future"].set_result(OVERLOADED)
+        return OVERLOADED
+
+# Drop timed-out entries once they make up most of the heap
+def _compact():
+    if len(queue) > 2 * queued + 64:
+        queue[:] = [item for item in queue if not item[2]["future"].done()]
+        heapq.heapify(queue)
+
+def _ensure_dispatcher():
+    global _wake, _dispatcher
+    loop = asyncio.get_running_loop()
+    if _dispatcher is None or _dispatcher.done() or _dispatcher.get_loop() is not loop:
+        _wake = asyncio.Event()
+        _dispatcher = loop.create_task(_dispatch_loop())
+
+async def _dispatch_loop():
+    global in_flight, queued
+    while True:
+        _wake.clear()
+        now = time.monotonic()
+        while queue and has_capacity(now):
+            _, _, entry = heapq.heappop(queue)
+            if entry["future"].done():
+                continue
+            entry["dispatched"] = True
+            queued -= 1
+            in_flight += 1
+            stats["admitted"] += 1
+            task = asyncio.ensure_future(_run(entry))
+            _tasks.add(task)
+            task.add_done_callback(_tasks.discard)
+
+        # Sleep until a slot frees up; with work waiting, also wake when the
+        # oldest pending transaction goes stale
+        timeout = None
+        if queued and pending:
+            timeout = max(0.0, next(iter(pending.values())) + ADMISSION_PENDING_TIMEOUT - now)
+        try:
+            await asyncio.wait_for(_wake.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+async def _execute(tx):
+    global in_flight
+    try:
+        result = await process_transaction(tx, verified=True)
+        if result.get("status") == "pending" and not vote_pool[tx["id"]]["confirmed"]:
+            pending[tx["id"]] = time.monotonic()
+        return result
+    finally:
+        in_flight -= 1
+        _notify()
+
+async def _run(entry):
+    try:
+        entry["future"].set_result(await _execute(entry["tx"]))
+    except Exception as e:
+        entry["future"].set_exception(e)
+
+def get_admission_stats():
+    _expire_pending(time.monotonic())
+    return {**stats, "in_flight": in_flight, "pending": len(pending), "queued": queued}
@@ -0,0 +1,293 @@
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import uuid
+from statistics import median
+
+import ledger
+from config import (BENCHMARK_BASELINE_FILE, BENCHMARK_BASELINE_RUNS,
+                    BENCHMARK_MIN_TIME, BENCHMARK_REPEATS,
+                    BENCHMARK_THRESHOLD)
+from crypto_utils import sign_data, verify_signature
+from ledger import append_block, get_head_block
+from nacl.signing import SigningKey
+from network import send_secure_message
+from node import connected_nodes, receive_vote, register_node, vote_pool
+
+# Workload shapes for each component
+CHAIN_LENGTHS = [10, 100, 1000]
+VALIDATOR_COUNTS = [5, 50, 500]
+
+
+class NullWebSocket:
+    # Stand-in for a peer connection so only the AES envelope is measured
+    async def send(self, data):
+        pass
+
+
+def sample_tx(signing_key):
+    return {
+        "id": uuid.uuid4().hex,
+        "type": "send",
+        "address": signing_key.verify_key.encode().hex(),
+        "receiver": SigningKey.generate().verify_key.encode().hex(),
+        "previous": "0" * 20,
+        "balance": "20.0",
+    }
+
+def write_chain(address, length):
+    # Build the account file directly so setup cost stays out of the timing
+    path = os.path.join(ledger.LEDGER_DIR, address)
+    previous = "0" * 20
+    with open(path, "w") as f:
+        for i in range(length):
+            block = {"id": uuid.uuid4().hex, "type": "send", "previous": previous, "balance": str(1000.0 - i)}
+            f.write(json.dumps(block) + "\n")
+            previous = block["id"]
+
+def reset_state():
+    connected_nodes.clear()
+    vote_pool.clear()
+
+
+# -- Benchmarks --
+# Each takes a requested op count and returns (ops, seconds) for one timed pass.
+async def bench_sign_data(ops):
+    signing_key = SigningKey.generate()
+    tx = sample_tx(signing_key)
+    start = time.perf_counter()
+    for _ in range(ops):
+        sign_data(tx, signing_key)
+    return ops, time.perf_counter() - start
+
+async def bench_verify_signature(ops):
+    signing_key = SigningKey.generate()
+    tx = sample_tx(signing_key)
+    tx["signature"] = sign_data(tx, signing_key).hex()
+    start = time.perf_counter()
+    for _ in range(ops):
+        verify_signature(tx, tx["signature"], tx["address"])
+    return ops, time.perf_counter() - start
+
+async def bench_send_secure_message(ops):
+    ws = NullWebSocket()
+    session_key = os.urandom(16)
+    signing_key = SigningKey.generate()
+    tx = sample_tx(signing_key)
+    tx["signature"] = sign_data(tx, signing_key).hex()
+    packet = {"type": "transaction", "tx": tx}
+    start = time.perf_counter()
+    for _ in range(ops):
+        await send_secure_message(ws, session_key, packet)
+    return ops, time.perf_counter() - start
+
+def make_bench_get_head_block(length):
+    async def bench(ops):
+        address = uuid.uuid4().hex
+        write_chain(address, length)
+        start = time.perf_counter()
+        for _ in range(ops):
+            await get_head_block(address)
+        return ops, time.perf_counter() - start
+    return bench
+
+async def bench_append_block(ops):
+    address = uuid.uuid4().hex
+    previous = "0" * 20
+    blocks = []
+    for i in range(ops):
+        block = {"id": uuid.uuid4().hex, "type": "send", "previous": previous, "balance": str(1000.0 - i)}
+        blocks.append(block)
+        previous = block["id"]
+    start = time.perf_counter()
+    for block in blocks:
+        await append_block(address, block)
+    return ops, time.perf_counter() - start
+
+def make_bench_receive_vote(validators):
+    async def bench(ops):
+        reset_state()
+        voters = [f"127.0.0.1:{20000 + i}" for i in range(validators)]
+        for addr in voters:
+            register_node(addr, is_full=True, weight=10.0)
+
+        # One op is one vote; a full round of votes is tallied on each of
+        # enough transactions to cover the requested op count. The threshold
+        # is out of reach so no vote confirms: confirmation writes two ledger
+        # blocks, and that file I/O would swamp the tally being measured.
+        signing_key = SigningKey.generate()
+        tx_ids = []
+        for _ in range(max(1, -(-ops // validators))):
+            tx = sample_tx(signing_key)
+            vote_pool[tx["id"]] = {"votes": [], "threshold": float("inf"), "confirmed": False, "tx": tx}
+            tx_ids.append(tx["id"])
+
+        start = time.perf_counter()
+        for tx_id in tx_ids:
+            for addr in voters:
+                await receive_vote(tx_id, addr, True)
+        elapsed = time.perf_counter() - start
+        reset_state()
+        return len(tx_ids) * validators, elapsed
+    return bench
+
+BENCHMARKS = {
+    "sign_data": bench_sign_data,
+    "verify_signature": bench_verify_signature,
+    "send_secure_message": bench_send_secure_message,
+    **{f"get_head_block[{n}]": make_bench_get_head_block(n) for n in CHAIN_LENGTHS},
+    "append_block": bench_append_block,
+    **{f"receive_vote[{n}]": make_bench_receive_vote(n) for n in VALIDATOR_COUNTS},
+}
+
+
+# -- Runner --
+# Grow the op count until one pass takes BENCHMARK_MIN_TIME; this doubles as warmup.
+async def calibrate(bench):
+    ops = 16
+    while True:
+        done, seconds = await bench(ops)
+        if seconds >= BENCHMARK_MIN_TIME:
+            return done
+        ops = ops * 2 if seconds <= 0 else max(ops * 2, int(ops * BENCHMARK_MIN_TIME / seconds * 1.1))
+
+async def run_benchmarks(repeats=BENCHMARK_REPEATS, only=None):
+    # Point the ledger at a scratch directory so real account chains are untouched
+    original_dir = ledger.LEDGER_DIR
+    scratch_dir = tempfile.mkdtemp(prefix="bench_ledger_")
+    ledger.LEDGER_DIR = scratch_dir
+
+    results = {}
+    try:
+        for name, bench in BENCHMARKS.items():
+            if only and not any(name.startswith(prefix) for prefix in only):
+                continue
+            ops = await calibrate(bench)
+            # Report the median pass so a single lucky or unlucky pass can't move the result
+            samples = []
+            total_ops, total_seconds = 0, 0.0
+            for _ in range(repeats):
+                done, seconds = await bench(ops)
+                samples.append(seconds / done * 1e6)
+                total_ops += done
+                total_seconds += seconds
+            us_per_op = median(samples)
+            results[name] = {
+                "ops": total_ops,
+                "seconds": total_seconds,
+                "us_per_op": us_per_op,
+                "ops_per_sec": 1e6 / us_per_op if us_per_op > 0 else 0.0,
+                "samples": samples,
+            }
+            print(f"⏱️ {name:<28} {us_per_op:>12.2f} µs/op {results[name]['ops_per_sec']:>12.1f} ops/s")
+    finally:
+        ledger.LEDGER_DIR = original_dir
+        shutil.rmtree(scratch_dir, ignore_errors=True)
+        reset_state()
+
+    return results
+
+# Repeat whole runs so the baseline records how far each benchmark drifts run to run
+async def run_baseline(runs=BENCHMARK_BASELINE_RUNS, repeats=BENCHMARK_REPEATS, only=None):
+    all_runs = []
+    for i in range(runs):
+        print(f"\n🔁 Run {i + 1}/{runs}")
+        all_runs.append(await run_benchmarks(repeats, only))
+
+    results = {}
+    for name in all_runs[0]:
+        per_run = [run[name]["us_per_op"] for run in all_runs]
+        us_per_op = median(per_run)
+        results[name] = {
+            "ops": sum(run[name]["ops"] for run in all_runs),
+            "seconds": sum(run[name]["seconds"] for run in all_runs),
+            "us_per_op": us_per_op,
+            "ops_per_sec": 1e6 / us_per_op if us_per_op > 0 else 0.0,
+            "samples": [sample for run in all_runs for sample in run[name]["samples"]],
+            "spread": max(per_run) / min(per_run) - 1 if min(per_run) > 0 else 0.0,
+        }
+    return results
+
+def save_results(results, path):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"created": time.time(), "results": results}, f, indent=2)
+    print(f"💾 Saved results to {path}")
+
+def load_results(path):
+    with open(path, "r") as f:
+        return json.load(f)["results"]
+
+def compare_results(baseline, current, threshold=BENCHMARK_THRESHOLD):
+    regressions = []
+    print(f"\n📊 Comparison (regression threshold: {threshold:.0%}, or the baseline's run-to-run spread if wider)")
+    for name, result in current.items():
+        if name not in baseline:
+            print(f"  {name:<28} {'new':>10}")
+            continue
+        # Noisy benchmarks get a threshold no tighter than their own measured drift
+        limit = max(threshold, baseline[name].get("spread", 0.0))
+        change = result["us_per_op"] / baseline[name]["us_per_op"] - 1
+        # A real slowdown hits every pass; noise rarely slows the fastest one too
+        best_change = change
+        if result.get("samples") and baseline[name].get("samples"):
+            best_change = min(result["samples"]) / min(baseline[name]["samples"]) - 1
+        flag = f"(limit {limit:.0%})"
+        if change > limit and best_change > limit:
+            flag += " ❌ REGRESSION"
+            regressions.append(name)
+        elif change < -limit:
+            flag += " ✅ faster"
+        print(f"  {name:<28} {change:>+10.1%} {flag}")
+    for name in baseline:
+        if name not in current:
+            print(f"  {name:<28} {'missing':>10} ❌ MISSING")
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Component microbenchmarks")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = sub.add_parser("run", help="Run benchmarks and store the results as a baseline")
+    run_parser.add_argument("--output", default=BENCHMARK_BASELINE_FILE)
+    run_parser.add_argument("--repeats", type=int, default=BENCHMARK_REPEATS)
+    run_parser.add_argument("--runs", type=int, default=BENCHMARK_BASELINE_RUNS, help="Full runs to measure run-to-run spread")
+    run_parser.add_argument("--only", nargs="*", help="Benchmark name prefixes to run")
+
+    compare_parser = sub.add_parser("compare", help="Compare against a stored baseline")
+    compare_parser.add_argument("--baseline", default=BENCHMARK_BASELINE_FILE)
+    compare_parser.add_argument("--current", help="Stored results to compare (runs benchmarks if omitted)")
+    compare_parser.add_argument("--threshold", type=float, default=BENCHMARK_THRESHOLD)
+    compare_parser.add_argument("--repeats", type=int, default=BENCHMARK_REPEATS)
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        results = asyncio.run(run_baseline(args.runs, args.repeats, args.only))
+        save_results(results, args.output)
+        return 0
+
+    baseline = load_results(args.baseline)
+    if args.current:
+        current = load_results(args.current)
+    else:
+        current = asyncio.run(run_benchmarks(args.repeats, list(baseline)))
+    regressions = compare_results(baseline, current, args.threshold)
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) or missing result(s): {', '.join(regressions)}")
+        return 1
+    print("\n✅ No regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,10 +2,10 @@ import asyncio
 import json
 import uuid
 
+from admission import get_admission_stats, submit_transaction
 from crypto_utils import load_or_generate_signing_key, sign_data
 from ledger import get_balance
-from node import (connected_nodes, process_transaction, receive_vote,
-                  register_node, vote_pool)
+from node import connected_nodes, receive_vote, register_node, vote_pool
 
 
 async def cli_loop():
@@ -18,6 +18,7 @@ async def cli_loop():
     print("5. Show Reputations")
     print("6. Exit")
     print("7. Connect to peer")  # Added option 7
+    print("8. Show Admission Stats")
 
     signing_key = load_or_generate_signing_key()
     address = signing_key.verify_key.encode().hex()[:16]  # short fake address for demo
@@ -44,7 +45,7 @@ async def cli_loop():
                 "balance": balance,
             }
             tx["signature"] = sign_data(tx, signing_key)
-            result = await process_transaction(tx)
+            result = await submit_transaction(tx)
             print(json.dumps(result, indent=2))
 
         elif choice == "3":
@@ -77,5 +78,10 @@ async def cli_loop():
             await connect_to_peer(url, rsa_keys)
             print(f"✅ Connected to peer at {url}")
 
+        elif choice == "8":
+            print("\n🚦 Admission:")
+            for key, value in get_admission_stats().items():
+                print(f"- {key}: {value}")
+
         else:
             print("❌ Invalid option. Try again.")
\ No newline at end of file
@@ -16,3 +16,25 @@ HANDSHAKE_KEY_FILE = "data/handshake_key.pem"
 REPUTATION_INIT = 10
 REPUTATION_INCREMENT = 1
 REPUTATION_PENALTY = 1
+
+# Admission control
+ADMISSION_RATE = 2.0            # tokens refilled per second, per account
+ADMISSION_BURST = 5.0           # max tokens an account can bank
+ADMISSION_MAX_PENDING = 512     # unconfirmed + in-flight transactions before queueing
+ADMISSION_PENDING_TIMEOUT = 60.0  # seconds before an unconfirmed tx stops counting against the cap
+ADMISSION_QUEUE_LIMIT = 256     # waiting transactions before new arrivals are shed
+ADMISSION_QUEUE_TIMEOUT = 5.0   # seconds a transaction may wait for capacity
+ADMISSION_IDLE_WEIGHT = 1.0     # priority boost for a fully idle account (1.0 = doubles it)
+ADMISSION_IDLE_CAP = 300.0      # seconds; idle time beyond this earns no extra priority
+ADMISSION_TRACKED_ACCOUNTS = 10000  # LRU bound on per-account buckets and last-seen times
+ADMISSION_TRACKED_TXS = 100000      # LRU bound on remembered transaction ids
+
+# Benchmarks
+BENCHMARK_BASELINE_FILE = "data/benchmarks/baseline.json"
+BENCHMARK_REPEATS = 5
+BENCHMARK_MIN_TIME = 0.2  # seconds each timed pass must run for
+BENCHMARK_BASELINE_RUNS = 3  # full runs recorded per baseline to measure run-to-run spread
+BENCHMARK_THRESHOLD = 0.10  # flag anything more than 10% slower per op
+
+# Ledger verification
+LEDGER_HEAD_INDEX_FILE = "data/head_index.json"
@@ -4,12 +4,14 @@ from collections import defaultdict
 
 import websockets
 
+from admission import submit_transaction
 from config import BOOTSTRAP_PORT
 from crypto_utils import aes_decrypt, aes_encrypt, rsa_decrypt, rsa_encrypt
-from node import process_transaction, receive_vote
+from node import receive_vote
 
 # In-memory peers list
 peers = {}  # {node_url: {"ws": websocket, "session_key": bytes}}
+pending_submissions = set()  # strong refs to in-progress submit_transaction tasks
 
 # Bootstrap public key exchange and AES key setup
 async def perform_handshake(ws, private_rsa_key, public_rsa_key):
@@ -71,7 +73,10 @@ async def handle_connection(websocket, path, rsa_keys):
                 continue
 
             if message["type"] == "transaction":
-                await process_transaction(message["tx"])
+                # Hand off without waiting so admission queueing never stalls this peer's votes
+                task = asyncio.ensure_future(submit_transaction(message["tx"]))
+                pending_submissions.add(task)
+                task.add_done_callback(pending_submissions.discard)
 
             elif message["type"] == "vote":
                 await receive_vote(message["tx_id"], message["node"], message["vote"])
@@ -33,14 +33,14 @@ def is_full_node(node_address):
     return connected_nodes.get(node_address, {}).get("is_full", False)
 
 # Process a new transaction and broadcast it
-async def process_transaction(tx):
+# verified=True skips the signature check for callers (admission) that already did it
+async def process_transaction(tx, verified=False):
     from network import broadcast_transaction  # Avoid circular dependency
 
     tx_id = tx["id"]
 
     # Verify signature against provided public key
-    valid = verify_signature(tx, tx["signature"], tx["address"])
-    if not valid:
+    if not verified and not verify_signature(tx, tx["signature"], tx["address"]):
         return {"status": "rejected", "reason": "invalid signature"}
 
     # Validate ledger history
@@ -66,11 +66,17 @@ async def process_transaction(tx):
 
 # Handle vote reception and check for consensus
 async def receive_vote(tx_id, node_address, vote_yes):
-    from network import broadcast_vote  # Avoid circular dependency
+    from admission import release  # Avoid circular dependency
+    from network import broadcast_vote
 
     if not is_full_node(node_address):
         return {"status": "rejected", "reason": "not eligible to vote"}
 
+    # Peers hand transactions to admission without waiting, so a vote can
+    # arrive before its transaction has been admitted
+    if tx_id not in vote_pool:
+        return {"status": "rejected", "reason": "unknown transaction"}
+
     vote_weight = get_voting_weight(node_address)
     vote_pool[tx_id]["votes"].append((node_address, vote_yes, vote_weight))
 
@@ -105,8 +111,9 @@ async def receive_vote(tx_id, node_address, vote_yes):
 
             await append_block(receiver_address, receive_block)
 
-        # Mark transaction as confirmed
+        # Mark transaction as confirmed and free its admission slot
         vote_pool[tx_id]["confirmed"] = True
+        release(tx_id)
 
         # Update reputations for correct voters
         for n, voted_yes, _ in vote_pool[tx_id]["votes"]:
@@ -0,0 +1,121 @@
+import asyncio
+import uuid
+
+import pytest
+from nacl.signing import SigningKey
+
+import admission
+from crypto_utils import sign_data
+from node import vote_pool
+
+
+@pytest.fixture(autouse=True)
+def reset_admission():
+    for table in (admission.buckets, admission.last_seen, admission.seen_txs, admission.pending, vote_pool):
+        table.clear()
+    admission.queue.clear()
+    admission.stats.update(dict.fromkeys(admission.stats, 0))
+    admission.queued = 0
+    admission.in_flight = 0
+    admission._dispatcher = None
+    admission._wake = None
+    yield
+
+
+def signed_tx(signing_key=None):
+    signing_key = signing_key or SigningKey.generate()
+    tx = {
+        "id": uuid.uuid4().hex,
+        "type": "send",
+        "address": signing_key.verify_key.encode().hex(),
+        "previous": "0" * 20,
+        "balance": "20.0",
+    }
+    tx["signature"] = sign_data(tx, signing_key).hex()
+    return tx
+
+
+def test_take_token_refills_over_time():
+    burst = int(admission.ADMISSION_BURST)
+    assert all(admission.take_token("acct", now=0.0) for _ in range(burst))
+    assert not admission.take_token("acct", now=0.0)
+    assert admission.take_token("acct", now=1.0 / admission.ADMISSION_RATE)
+    assert not admission.take_token("acct", now=1.0 / admission.ADMISSION_RATE)
+
+
+def test_priority_score_ordering():
+    # Funded beats unfunded however idle; idle time boosts funded accounts
+    assert admission.priority_score(100.0, 0.0) > admission.priority_score(0.0, admission.ADMISSION_IDLE_CAP)
+    assert admission.priority_score(0.0, admission.ADMISSION_IDLE_CAP) == 0.0
+    assert admission.priority_score(100.0, 60.0) > admission.priority_score(100.0, 2.0)
+    assert admission.priority_score(1000.0, 0.0) > admission.priority_score(100.0, 0.0)
+
+
+def test_forged_txs_do_not_charge_victim():
+    async def run():
+        victim = SigningKey.generate()
+        for _ in range(int(admission.ADMISSION_BURST) + 1):
+            forged = signed_tx()
+            forged["address"] = victim.verify_key.encode().hex()
+            result = await admission.submit_transaction(forged)
+            assert result["reason"] == "invalid signature"
+        return await admission.submit_transaction(signed_tx(victim))
+
+    assert asyncio.run(run())["status"] == "pending"
+
+
+def test_retry_after_rate_limited():
+    async def run():
+        key = SigningKey.generate()
+        for _ in range(int(admission.ADMISSION_BURST)):
+            assert (await admission.submit_transaction(signed_tx(key)))["status"] == "pending"
+        tx = signed_tx(key)
+        assert (await admission.submit_transaction(tx))["reason"] == "rate limited"
+
+        # After a refill the same signed tx must go through, not be flagged duplicate
+        admission.buckets[tx["address"]]["updated"] -= 1.0 / admission.ADMISSION_RATE
+        assert (await admission.submit_transaction(tx))["status"] == "pending"
+        assert (await admission.submit_transaction(tx))["reason"] == "duplicate"
+
+    asyncio.run(run())
+
+
+def test_sheds_at_queue_limit(monkeypatch):
+    monkeypatch.setattr(admission, "ADMISSION_MAX_PENDING", 0)
+    monkeypatch.setattr(admission, "ADMISSION_QUEUE_LIMIT", 2)
+    monkeypatch.setattr(admission, "ADMISSION_QUEUE_TIMEOUT", 0.2)
+
+    async def run():
+        waiters = [asyncio.ensure_future(admission.submit_transaction(signed_tx())) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        assert admission.queued == 2
+
+        # Queue full: shed immediately rather than waiting out the timeout
+        extra = await asyncio.wait_for(admission.submit_transaction(signed_tx()), 0.1)
+        assert extra["reason"] == "overloaded"
+
+        # Queued ones time out once no capacity frees up
+        results = await asyncio.gather(*waiters)
+        assert [r["reason"] for r in results] == ["overloaded", "overloaded"]
+        assert admission.queued == 0
+        assert admission.stats["shed"] == 3
+        assert not vote_pool
+
+    asyncio.run(run())
+
+
+def test_confirmation_frees_slot_for_queued_tx(monkeypatch):
+    monkeypatch.setattr(admission, "ADMISSION_MAX_PENDING", 1)
+
+    async def run():
+        first = await admission.submit_transaction(signed_tx())
+        assert first["status"] == "pending"
+        waiter = asyncio.ensure_future(admission.submit_transaction(signed_tx()))
+        await asyncio.sleep(0.05)
+        assert admission.queued == 1
+
+        vote_pool[first["tx_id"]]["confirmed"] = True
+        admission.release(first["tx_id"])
+        assert (await asyncio.wait_for(waiter, 1.0))["status"] == "pending"
+
+    asyncio.run(run())
@@ -0,0 +1,184 @@
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from config import LEDGER_DIR, LEDGER_HEAD_INDEX_FILE
+from crypto_utils import verify_signature
+
+GENESIS_PREVIOUS = "0" * 20
+
+
+# -- Map: verify one account-chain in isolation --
+def verify_account(ledger_dir, account):
+    errors = []
+    sends = {}     # { send_id: {"receiver": ..., "balance": ...} }
+    receives = []  # [ {"id", "source", "balance", "prev_balance"} ]
+    head = None
+    count = 0
+
+    path = os.path.join(ledger_dir, account)
+    try:
+        with open(path, "r") as f:
+            lines = [line for line in f if line.strip()]
+    except (OSError, UnicodeDecodeError) as e:
+        errors.append(f"{account}: unreadable file ({e})")
+        return {"account": account, "blocks": 0, "head": None, "errors": errors, "sends": sends, "receives": receives}
+
+    previous_id = GENESIS_PREVIOUS
+    previous_balance = None
+    for index, line in enumerate(lines):
+        where = f"{account}[{index}]"
+        try:
+            block = json.loads(line)
+            balance = float(block["balance"])
+            block_id = block["id"]
+        except (ValueError, KeyError, TypeError) as e:
+            errors.append(f"{where}: unreadable block ({e})")
+            continue
+        count += 1
+
+        if block.get("previous") != previous_id:
+            errors.append(f"{where}: previous {block.get('previous')} does not match {previous_id}")
+
+        if block.get("type") == "send" or "signature" in block:
+            if block.get("address") != account:
+                errors.append(f"{where}: address {block.get('address')} does not own this chain")
+            try:
+                valid = verify_signature(block, block["signature"], account)
+            except Exception:
+                valid = False
+            if not valid:
+                errors.append(f"{where}: invalid signature")
+
+        if block.get("type") == "send":
+            if previous_balance is not None and balance > previous_balance:
+                errors.append(f"{where}: overspend ({balance} > {previous_balance})")
+            sends[block_id] = {"receiver": block.get("receiver"), "balance": balance}
+
+        elif block.get("type") == "receive":
+            source = block.get("source")
+            if block_id != f"{source}_recv":
+                errors.append(f"{where}: receive id {block_id} does not match source {source}")
+            receives.append({"id": block_id, "source": source, "balance": balance, "prev_balance": previous_balance})
+
+        previous_id = block_id
+        previous_balance = balance
+        head = {"head": block_id, "balance": block["balance"], "blocks": count}
+
+    if head is None:
+        errors.append(f"{account}: no blocks found")
+
+    return {"account": account, "blocks": count, "head": head, "errors": errors, "sends": sends, "receives": receives}
+
+
+# -- Reduce: cross-check send/receive pairs across chains --
+# Returns (account, message) pairs so each problem can be pinned to a chain.
+def cross_check(results):
+    errors = []
+    sends = {}
+    for result in results:
+        for send_id, send in result["sends"].items():
+            if send_id in sends:
+                errors.append((result["account"], f"duplicate send id {send_id}"))
+            sends[send_id] = dict(send, account=result["account"])
+
+    received = set()
+    for result in results:
+        account = result["account"]
+        for recv in result["receives"]:
+            source = sends.get(recv["source"])
+            if source is None:
+                errors.append((account, f"receive {recv['id']} has no matching send"))
+                continue
+            if source["receiver"] != account:
+                errors.append((account, f"receive {recv['id']} but send was addressed to {source['receiver']}"))
+            if recv["source"] in received:
+                errors.append((account, f"send {recv['source']} received more than once"))
+            received.add(recv["source"])
+
+            # Mirrors receive_vote: the receive balance adds the send block's balance
+            expected = source["balance"] if recv["prev_balance"] is None else recv["prev_balance"] + source["balance"]
+            if abs(recv["balance"] - expected) > 1e-9:
+                errors.append((account, f"receive {recv['id']} balance {recv['balance']} expected {expected}"))
+
+    for send_id, send in sends.items():
+        if send["receiver"] and send_id not in received:
+            errors.append((send["account"], f"send {send_id} was never received by {send['receiver']}"))
+
+    return errors
+
+
+def verify_ledger(ledger_dir=LEDGER_DIR, workers=None):
+    accounts = [f for f in os.listdir(ledger_dir) if os.path.isfile(os.path.join(ledger_dir, f))]
+    chunksize = max(1, len(accounts) // ((workers or os.cpu_count() or 1) * 4))
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(verify_account, [ledger_dir] * len(accounts), accounts, chunksize=chunksize))
+
+    errors = [e for result in results for e in result["errors"]]
+    failed = {result["account"] for result in results if result["errors"]}
+    for account, message in cross_check(results):
+        errors.append(f"{account}: {message}")
+        failed.add(account)
+    elapsed = time.perf_counter() - start
+
+    # Heads of chains that failed any check are kept but flagged, so a restore
+    # can tell which ones are trustworthy
+    blocks = sum(result["blocks"] for result in results)
+    head_index = {
+        result["account"]: dict(result["head"], valid=result["account"] not in failed)
+        for result in results if result["head"]
+    }
+    return {
+        "accounts": len(accounts),
+        "blocks": blocks,
+        "seconds": elapsed,
+        "blocks_per_sec": blocks / elapsed if elapsed > 0 else 0.0,
+        "errors": errors,
+        "failed_accounts": sorted(failed),
+        "head_index": head_index,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Verify ledger integrity and rebuild the head index")
+    parser.add_argument("--ledger-dir", default=LEDGER_DIR)
+    parser.add_argument("--workers", type=int, default=None, help="Process pool size (default: CPU count)")
+    parser.add_argument("--output", default=LEDGER_HEAD_INDEX_FILE, help="Where to write the rebuilt head index")
+    args = parser.parse_args()
+
+    report = verify_ledger(args.ledger_dir, args.workers)
+
+    directory = os.path.dirname(args.output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump(report["head_index"], f, indent=2)
+
+    print("\n🔎 Ledger Verification Report")
+    print(f" Accounts: {report['accounts']}")
+    print(f" Blocks: {report['blocks']}")
+    print(f" Duration: {report['seconds']:.2f} seconds")
+    print(f" Throughput: {report['blocks_per_sec']:.1f} blocks/s")
+    print(f" Head index: {args.output}")
+    if report["failed_accounts"]:
+        missing = [a for a in report["failed_accounts"] if a not in report["head_index"]]
+        print(f" Untrusted accounts: {len(report['failed_accounts'])} (flagged \"valid\": false in the index)")
+        if missing:
+            print(f" Left out of the index (no readable head): {', '.join(missing)}")
+
+    if report["errors"]:
+        print(f"\n❌ {len(report['errors'])} problem(s) found:")
+        for error in report["errors"]:
+            print(f"- {error}")
+        return 1
+    print("\n✅ Ledger is consistent")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())